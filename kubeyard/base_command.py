@@ -2,10 +2,9 @@ import abc
 import logging
 import pathlib
 
-from cached_property import cached_property
-
 from kubeyard import context_factories
 from kubeyard import settings
+from kubeyard.compat import cached_property
 
 logger = logging.getLogger(__name__)
 
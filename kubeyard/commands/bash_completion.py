@@ -4,8 +4,6 @@ import tempfile
 
 import sh
 
-import kubeyard.files_generator
-
 from kubeyard import base_command
 
 logger = logging.getLogger(__name__)
@@ -28,6 +26,7 @@ class InstallCompletion(base_command.BaseCommand):
         if self.completion_dst.exists() and not self.force:
             logger.warning('File {} already exists. Skipping.'.format(str(self.completion_dst)))
         else:
+            import kubeyard.files_generator
             with tempfile.NamedTemporaryFile(mode='r') as f:
                 completion_dst_tmp = pathlib.Path(f.name)
                 kubeyard.files_generator.copy_template('kubeyard-completion.sh', completion_dst_tmp, replace=True)
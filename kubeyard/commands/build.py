@@ -20,6 +20,7 @@ class BuildCommand(BaseDevelCommand):
         self.docker_args = docker_args or ''
 
     def run_default(self):
+        image = self.image
         image_context = self.image_context or "{0}/docker".format(self.project_dir)
-        logger.info('Building image "{}"...'.format(self.image))
-        self.docker_with_output('build', '-t', self.image, *shlex.split(self.docker_args),  image_context)
+        logger.info('Building image "{}"...'.format(image))
+        self.docker_with_output('build', '-t', image, *shlex.split(self.docker_args),  image_context)
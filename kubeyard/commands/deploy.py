@@ -1,19 +1,17 @@
 import getpass
 import logging
+import shlex
 import sys
 
-import kubepy.appliers
 import sh
 
-from cached_property import cached_property
-from kubepy import appliers_options
-
 from kubeyard import base_command
 from kubeyard import kubernetes
 from kubeyard import settings
 from kubeyard.commands.devel import MAX_JOB_RETRIES
 from kubeyard.commands.devel import BaseDevelCommand
 from kubeyard.commands.devel import DockerRunner
+from kubeyard.compat import cached_property
 
 logger = logging.getLogger(__name__)
 
@@ -56,13 +54,14 @@ class DeployCommand(BaseDevelCommand):
         self.upload_local_binary_path = upload_local_binary_path
 
     def run_default(self):
+        is_development = self.is_development
         if self.should_deploy_statics:
             self.run_statics_deploy()
         if self.definition_directories:
-            if self.dev_requirements and self.is_development:
+            if is_development and self.dev_requirements:
                 self.run_dev_requirements_deploy()
             self.run_kubernetes_deploy()
-        if self.is_development:
+        if is_development:
             DomainConfigurator(self.context).configure()
 
     @property
@@ -73,6 +72,7 @@ class DeployCommand(BaseDevelCommand):
     def static_files_storage(self):
         return static_files_storage_factory(
             self.context,
+            self.docker_runner,
             self.image,
             self.gcs_service_key_file,
             self.aws_credentials,
@@ -87,19 +87,22 @@ class DeployCommand(BaseDevelCommand):
         logger.info('Static files uploaded')
 
     def run_kubernetes_deploy(self):
+        from kubepy import appliers
+        from kubepy import appliers_options
+        build_url = self.build_url
         pod_annotations = {}
-        if self.build_url is not None:
-            pod_annotations['kubeyard/build-url'] = self.build_url
+        if build_url is not None:
+            pod_annotations['kubeyard/build-url'] = build_url
         options = appliers_options.Options(
             build_tag=self.tag, replace=self.is_development, host_volumes=self.host_volumes,
             max_job_retries=MAX_JOB_RETRIES, pod_annotations=pod_annotations,
         )
         kubernetes.install_secrets(self.context)
         logger.info('Applying Kubernetes definitions from YAML files...')
-        kubepy.appliers.DirectoriesApplier(self.definition_directories, options).apply_all()
+        appliers.DirectoriesApplier(self.definition_directories, options).apply_all()
         logger.info('Kubernetes definitions applied')
 
-    @property
+    @cached_property
     def definition_directories(self):
         kubernetes_dir = self.project_dir / settings.DEFAULT_KUBERNETES_DEPLOY_DIR
         overrides_dir = self.project_dir / settings.DEFAULT_KUBERNETES_DEV_DEPLOY_OVERRIDES_DIR
@@ -110,13 +113,14 @@ class DeployCommand(BaseDevelCommand):
             definition_directories.append(overrides_dir)
         return definition_directories
 
-    @property
+    @cached_property
     def host_volumes(self):
-        if self.is_development:
+        dev_mounted_paths = self.context.get('DEV_MOUNTED_PATHS')
+        if self.is_development and dev_mounted_paths:
             mounted_project_dir = self.cluster.get_mounted_project_dir(self.project_dir)
             return {
                 volume['name']: mounted_project_dir / volume['host-path']
-                for volume in self.context.get('DEV_MOUNTED_PATHS', [])
+                for volume in dev_mounted_paths
             }
         else:
             return {}
@@ -192,11 +196,10 @@ class DomainConfigurator:
         return False
 
 
-def static_files_storage_factory(context, image, gcs_service_key_file, aws_credentials, azure_connection_string,
-                                 bucket_name, local_binary_path):
+def static_files_storage_factory(context, docker_runner: DockerRunner, image, gcs_service_key_file, aws_credentials,
+                                 azure_connection_string, bucket_name, local_binary_path):
     statics_directory = context.get('STATICS_DIRECTORY')
     collect_statics_command = context.get('COLLECT_STATICS_COMMAND', 'collect_statics_tar')
-    docker_runner = DockerRunner(context)
     bucket_name = bucket_name or context.get('BUCKET_NAME')
     arguments = {
         'statics_directory': statics_directory,
@@ -278,19 +281,26 @@ class GCSFilesStorage(FilesStorage):
         self.bucket_name = bucket_name
 
     def upload_tarred_files(self, statics_tar_process):
-
-        with self.docker_runner.temporary_volume() as volume_name:
-            self._save_tar_to_volume(statics_tar_process, volume_name)
-            self.docker_runner.run_with_output(
-                'run', '-i', '--rm',
-                '-v', '{}:/service-account.json:ro'.format(self.service_key_file),
-                '-v', '{}:/upload/:ro'.format(volume_name),
-                self.cloud_sdk_image,
-                'gsutil',
-                '-m',
-                '-o', 'Credentials:gs_service_key_file=/service-account.json',
-                'cp', '-r', '/upload/*', 'gs://{}/{}/'.format(self.bucket_name, self.statics_directory),
-            )
+        gsutil_command = [
+            'gsutil',
+            '-m',
+            '-o', 'GSUtil:parallel_composite_upload_threshold=50M',
+            '-o', 'GSUtil:parallel_thread_count=8',
+            '-o', 'GSUtil:parallel_process_count=4',
+            '-o', 'Credentials:gs_service_key_file=/service-account.json',
+            'cp', '-r', '/upload/*', 'gs://{}/{}/'.format(self.bucket_name, self.statics_directory),
+        ]
+        self.docker_runner.run_with_output(
+            statics_tar_process,
+            'run', '-i', '--rm',
+            '-v', '{}:/service-account.json:ro'.format(self.service_key_file),
+            self.cloud_sdk_image,
+            'bash', '-c', ' && '.join([
+                'mkdir /upload',
+                'tar xf - -C /upload',
+                ' '.join(shlex.quote(argument) for argument in gsutil_command),
+            ]),
+        )
 
 
 class S3FilesStorage(FilesStorage):
@@ -298,18 +308,17 @@ class S3FilesStorage(FilesStorage):
                  credentials, bucket_name):
         super().__init__(statics_directory, collect_statics_command, image, docker_runner, local_binary_path)
         self.bucket_name = bucket_name
-        if ':' in credentials:
-            self.access_key, self.secret_key = credentials.split(':', 2)
-        else:
+        self.access_key, separator, self.secret_key = credentials.partition(':')
+        if not separator:
             raise base_command.CommandException('AWS credentials should be in form access_key:secret_key.')
 
     def upload_tarred_files(self, statics_tar_process):
         upload_statics_run_command = [
             'run', '-i', '--rm',
-            '-e', 'AWS_ACCESS_KEY={}'.format(self.access_key),
-            '-e', 'AWS_SECRET_KEY={}'.format(self.secret_key),
-            '-e', 'UPLOAD_BUCKET={}'.format(self.bucket_name),
-            '-e', 'UPLOAD_PATH={}/'.format(self.statics_directory),
+            '-e', f'AWS_ACCESS_KEY={self.access_key}',
+            '-e', f'AWS_SECRET_KEY={self.secret_key}',
+            '-e', f'UPLOAD_BUCKET={self.bucket_name}',
+            '-e', f'UPLOAD_PATH={self.statics_directory}/',
             'socialwifi/aws-utils:1.0.0', 'upload_tar',
         ]
         self.docker_runner.run_with_output(statics_tar_process, *upload_statics_run_command)
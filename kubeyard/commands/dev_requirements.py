@@ -11,25 +11,25 @@ definitions_directory = pathlib.Path(__file__).parent.parent / 'definitions' / '
 
 
 class Requirement:
-    valid_arguments = ()
+    valid_arguments = frozenset()
 
     def __init__(self, context: dict):
         self.context = context
 
     def __call__(self, arguments: dict):
-        if all(key in self.valid_arguments for key in arguments.keys()):
+        if self.valid_arguments.issuperset(arguments):
             self.run(arguments)
         else:
             logger.warning(
                 'Requirement configuration is not valid: {}\n'
-                'Available options are: {}'.format(arguments, self.valid_arguments))
+                'Available options are: {}'.format(arguments, ', '.join(sorted(self.valid_arguments)) or 'none'))
 
     def run(self, arguments: dict):
         raise NotImplementedError
 
 
 class Postgres(Requirement):
-    valid_arguments = ('name')
+    valid_arguments = frozenset({'name'})
 
     def run(self, arguments: dict):
         database_name = arguments.get('name') or self.context['KUBE_SERVICE_NAME']
@@ -57,7 +57,7 @@ class PostgresDependency(dependencies.KubernetesDependency):
 
 
 class CockroachDB(Requirement):
-    valid_arguments = ('name',)
+    valid_arguments = frozenset({'name'})
 
     def run(self, arguments: dict):
         database_name = arguments.get('name') or self.context['KUBE_SERVICE_NAME']
@@ -86,7 +86,7 @@ class CockroachDBDependency(dependencies.KubernetesDependency):
 
 
 class Elasticsearch(Requirement):
-    valid_arguments = ()
+    valid_arguments = frozenset()
 
     def run(self, arguments: dict):
         self.ensure_elastic_running()
@@ -102,7 +102,7 @@ class ElasticsearchDependency(dependencies.KubernetesDependency):
 
 
 class PubSubEmulator(Requirement):
-    valid_arguments = ('topic', 'subscription')
+    valid_arguments = frozenset({'topic', 'subscription'})
 
     def run(self, arguments: dict):
         topic_name = arguments.get('topic') or self.context['KUBE_SERVICE_NAME']
@@ -148,7 +148,7 @@ class PubSubDependency(dependencies.KubernetesDependency):
 
 
 class Redis(Requirement):
-    valid_arguments = ('name', )
+    valid_arguments = frozenset({'name'})
     secret_name = 'redis-urls'
 
     def run(self, arguments: dict):
@@ -186,7 +186,7 @@ class RedisDependency(dependencies.KubernetesDependency):
 
 
 class Cassandra(Requirement):
-    valid_arguments = ('keyspace')
+    valid_arguments = frozenset({'keyspace'})
 
     def run(self, arguments: dict):
         keyspace_name = arguments.get('keyspace') or self.context['KUBE_SERVICE_NAME']
@@ -223,7 +223,7 @@ class CassandraDependency(dependencies.KubernetesDependency):
 
 
 class RabbitMQ(Requirement):
-    valid_arguments = ()
+    valid_arguments = frozenset()
 
     def run(self, arguments: dict):
         dependency = RabbitMQDependency()
@@ -258,13 +258,12 @@ class RequirementsDispatcher:
                 logger.warning("Skipping requirement without specified kind. Requirement: {}".format(requirement))
 
     def dispatch(self, requirement: dict):
-        arguments = requirement.copy()
-        kind = arguments.pop('kind')
+        kind = requirement['kind']
         logger.info('Checking requirement of kind "{}"...'.format(kind))
-        try:
-            command = self.commands[kind](self.context)
-        except KeyError:
+        requirement_class = self.commands.get(kind)
+        if requirement_class is None:
             logger.warning('Kind "{}" is not supported!'.format(kind))
         else:
-            command(arguments)
+            arguments = {key: value for key, value in requirement.items() if key != 'kind'}
+            requirement_class(self.context)(arguments)
             logger.info('Requirement of kind "{}" satisfied'.format(kind))
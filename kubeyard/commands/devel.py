@@ -10,12 +10,11 @@ from contextlib import contextmanager
 
 import sh
 
-from cached_property import cached_property
-
 from kubeyard import base_command
 from kubeyard import minikube
 from kubeyard import settings
 from kubeyard.commands import custom_script
+from kubeyard.compat import cached_property
 
 logger = logging.getLogger(__name__)
 
@@ -65,11 +64,11 @@ class BaseDevelCommand(base_command.InitialisedRepositoryCommand):
 
     @property
     def image(self):
-        return '{}/{}:{}'.format(self.docker_repository, self.image_name, self.tag)
+        return f'{self.docker_repository}/{self.image_name}:{self.tag}'
 
     @property
     def latest_image(self):
-        return '{}/{}:latest'.format(self.docker_repository, self.image_name)
+        return f'{self.docker_repository}/{self.image_name}:latest'
 
     @property
     def docker_repository(self):
@@ -90,7 +89,7 @@ class BaseDevelCommand(base_command.InitialisedRepositoryCommand):
         else:
             return 'latest'
 
-    @property
+    @cached_property
     def is_development(self):
         return self.context['KUBEYARD_MODE'] == 'development'
 
@@ -102,16 +101,20 @@ class BaseDevelCommand(base_command.InitialisedRepositoryCommand):
     def custom_script_name(self):
         raise NotImplementedError
 
-    @property
-    def volumes(self) -> typing.Iterable[str]:
+    @cached_property
+    def volumes(self) -> typing.List[str]:
+        volumes = []
         if self.is_development:
             mounted_project_dir = self.cluster.get_mounted_project_dir(self.project_dir)
+            image_name = self.image_name
             for volume in self.context.get('DEV_MOUNTED_PATHS', []):
-                if 'mount-in-tests' in volume and volume['mount-in-tests']['image-name'] == self.image_name:
+                mount_in_tests = volume.get('mount-in-tests')
+                if mount_in_tests and mount_in_tests['image-name'] == image_name:
                     host_path = str(mounted_project_dir / volume['host-path'])
-                    container_path = volume['mount-in-tests']['path']
-                    mount_mode = self.get_mount_mode(volume['mount-in-tests'])
-                    yield from ['-v', '{}:{}:{}'.format(host_path, container_path, mount_mode)]
+                    container_path = mount_in_tests['path']
+                    mount_mode = self.get_mount_mode(mount_in_tests)
+                    volumes += ['-v', '{}:{}:{}'.format(host_path, container_path, mount_mode)]
+        return volumes
 
     def get_mount_mode(self, configuration):
         mount_mode = configuration.get('mount-mode', 'ro')
@@ -138,7 +141,7 @@ class DockerRunner:
 
     def run(self, *args, **kwargs):
         if self.run_can_be_waited(*args, **kwargs):
-            process: sh.RunningCommand = sh.docker(*args, _env=self.sh_env, _bg=True, **kwargs)
+            process: sh.RunningCommand = self._docker(*args, _bg=True, **kwargs)
             try:
                 process.wait()
             except KeyboardInterrupt as e:
@@ -146,7 +149,7 @@ class DockerRunner:
                 process.signal(signal.SIGINT)
                 raise e
         else:
-            process: sh.RunningCommand = sh.docker(*args, _env=self.sh_env, **kwargs)
+            process: sh.RunningCommand = self._docker(*args, **kwargs)
         return process
 
     def run_can_be_waited(self, *args, _piped=False, _iter=False, _iter_noblock=False, **kwargs) -> bool:
@@ -156,6 +159,36 @@ class DockerRunner:
     def run_with_output(self, *args, **kwargs):
         return self.run(*args, _out=sys.stdout.buffer, _err=sys.stdout.buffer, **kwargs)
 
+    def run_in_parallel_with_output(self, *commands: typing.Sequence[str]):
+        """
+        Runs every command (a sequence of docker arguments) at once and waits for all of them.
+        Output is buffered and printed per command in the given order, so it does not interleave.
+        If any command fails or waiting is interrupted, commands still running are stopped.
+        """
+        processes: typing.List[sh.RunningCommand] = [
+            self._docker(*args, _bg=True, _bg_exc=False, _err_to_out=True) for args in commands
+        ]
+        try:
+            for process in processes:
+                try:
+                    process.wait()
+                except sh.ErrorReturnCode as e:
+                    sys.stdout.buffer.write(e.stdout)
+                    raise e
+                sys.stdout.buffer.write(process.stdout)
+                sys.stdout.buffer.flush()
+        except (KeyboardInterrupt, sh.ErrorReturnCode) as e:
+            logger.info("Stopping running commands...")
+            for process in processes:
+                if process.is_alive():
+                    process.signal(signal.SIGINT)
+            raise e
+        return processes
+
+    @cached_property
+    def _docker(self) -> sh.Command:
+        return sh.docker.bake(_env=self.sh_env)
+
     @cached_property
     def sh_env(self):
         env = os.environ.copy()
@@ -5,6 +5,7 @@ import typing
 import sh
 
 from kubeyard.commands.devel import BaseDevelCommand
+from kubeyard.compat import cached_property
 
 logger = logging.getLogger(__name__)
 
@@ -19,15 +20,19 @@ class FixCodeStyleCommand(BaseDevelCommand):
     """
     custom_script_name = 'fix_code_style'
 
-    @property
-    def volumes(self) -> typing.Iterable[str]:
+    @cached_property
+    def volumes(self) -> typing.List[str]:
+        volumes = []
         if self.is_development:
             mounted_project_dir = self.cluster.get_mounted_project_dir(self.project_dir)
+            image_name = self.image_name
             for volume in self.context.get('DEV_MOUNTED_PATHS', []):
-                if 'mount-in-tests' in volume and volume['mount-in-tests']['image-name'] == self.image_name:
+                mount_in_tests = volume.get('mount-in-tests')
+                if mount_in_tests and mount_in_tests['image-name'] == image_name:
                     host_path = str(mounted_project_dir / volume['host-path'])
-                    container_path = volume['mount-in-tests']['path']
-                    yield from ['-v', '{}:{}:rw'.format(host_path, container_path)]
+                    container_path = mount_in_tests['path']
+                    volumes += ['-v', '{}:{}:rw'.format(host_path, container_path)]
+        return volumes
 
     def run_default(self):
         try:
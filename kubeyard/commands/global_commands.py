@@ -1,23 +1,25 @@
-import contextlib
 import logging
 import pathlib
 
-import yaml
-
 from kubeyard import ascii_art
 from kubeyard import base_command
 from kubeyard import context_factories
 from kubeyard import dependencies
 from kubeyard import kubernetes
 from kubeyard import settings
+from kubeyard.compat import cached_property
 
 logger = logging.getLogger(__name__)
 
 
 class GlobalCommand(base_command.BaseCommand):
-    @property
+    @cached_property
+    def global_context_factory(self):
+        return context_factories.GlobalContextFactory()
+
+    @cached_property
     def context(self):
-        return context_factories.GlobalContextFactory().get()
+        return self.global_context_factory.get()
 
 
 class SetupCommand(GlobalCommand):
@@ -43,13 +45,12 @@ class SetupCommand(GlobalCommand):
         kubeyard_mode = self.get_kubeyard_mode()
         user_context['KUBEYARD_MODE'] = kubeyard_mode
         self.print_info(kubeyard_mode)
-        with self.user_context_filepath.open('w') as context_file:
-            yaml.dump(dict(user_context), stream=context_file, default_flow_style=False)
+        context_factories.save_context(self.user_context_filepath, user_context)
         new_context = dict(self.context, **user_context)
         kubernetes.setup_cluster_context(new_context)
 
     def get_current_user_context(self):
-        return context_factories.GlobalContextFactory().user_context
+        return self.global_context_factory.user_context
 
     def get_kubeyard_mode(self):
         minikube_installed = dependencies.is_command_available('minikube')
@@ -72,18 +73,16 @@ class SetupCommand(GlobalCommand):
         ascii_art.print_ascii_art()
         logger.info('Setting up {} mode...'.format(kubeyard_mode))
 
-    @property
+    @cached_property
     def user_context_filepath(self):
         user_context_filepath = pathlib.Path(self.context['KUBEYARD_USER_CONTEXT_FILEPATH'])
-        with contextlib.suppress(FileExistsError):
-            user_context_filepath.parent.mkdir()
+        user_context_filepath.parent.mkdir(parents=True, exist_ok=True)
         return user_context_filepath
 
-    @property
+    @cached_property
     def default_global_secrets_directory(self):
         global_secrets = self.user_context_filepath.parent / 'global-secrets/'
-        with contextlib.suppress(FileExistsError):
-            global_secrets.mkdir()
+        global_secrets.mkdir(exist_ok=True)
         return global_secrets
 
 
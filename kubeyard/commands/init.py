@@ -4,8 +4,6 @@ import pathlib
 import random
 import string
 
-import kubeyard.files_generator
-
 from kubeyard import base_command
 from kubeyard import context_factories
 from kubeyard import settings
@@ -26,37 +24,42 @@ class InitCommand(base_command.BaseCommand):
         self.init_type = init_type
 
     def run(self):
+        import kubeyard.files_generator
+
         logger.info("Initialising repo...")
         project_dst = pathlib.Path(self.directory)
-        context = context_factories.EmptyRepoContextFactory(self.directory, self.init_type.prompted_context).get()
+        context = context_factories.EmptyRepoContextFactory(self.directory, self.init_type.prompted_context()).get()
         template_location = f'new_repositories/{self.init_type.name}'
         kubeyard.files_generator.copy_template(template_location, project_dst, context=context)
 
 
 class InitType(metaclass=abc.ABCMeta):
     name: str = NotImplemented
-    prompted_context = [
-        context_factories.PromptedContext(
-            variable='PROJECT_NAME',
-            prompt='project name',
-            default=settings.DEFAULT_PROJECT_NAME_PATTERN,
-        ),
-        context_factories.PromptedContext(
-            variable='KUBE_SERVICE_NAME',
-            prompt='service name',
-            default=settings.DEFAULT_KUBE_SERVICE_NAME_PATTERN,
-        ),
-        context_factories.PromptedContext(
-            variable='KUBE_SERVICE_PORT',
-            prompt='service port',
-            default=settings.DEFAULT_KUBE_SERVICE_PORT,
-        ),
-        context_factories.PromptedContext(
-            variable='DOCKER_REGISTRY_NAME',
-            prompt='docker registry name',
-            default=settings.DEFAULT_DOCKER_REGISTRY_NAME,
-        ),
-    ]
+
+    @classmethod
+    def prompted_context(cls):
+        return (
+            context_factories.PromptedContext(
+                variable='PROJECT_NAME',
+                prompt='project name',
+                default=settings.DEFAULT_PROJECT_NAME_PATTERN,
+            ),
+            context_factories.PromptedContext(
+                variable='KUBE_SERVICE_NAME',
+                prompt='service name',
+                default=settings.DEFAULT_KUBE_SERVICE_NAME_PATTERN,
+            ),
+            context_factories.PromptedContext(
+                variable='KUBE_SERVICE_PORT',
+                prompt='service port',
+                default=settings.DEFAULT_KUBE_SERVICE_PORT,
+            ),
+            context_factories.PromptedContext(
+                variable='DOCKER_REGISTRY_NAME',
+                prompt='docker registry name',
+                default=settings.DEFAULT_DOCKER_REGISTRY_NAME,
+            ),
+        )
 
 
 class PythonPackageInitType(InitType):
@@ -65,24 +68,30 @@ class PythonPackageInitType(InitType):
 
 class PythonDjangoInitType(InitType):
     name = 'django'
-    prompted_context = InitType.prompted_context + [
-        context_factories.PromptedContext(
-            variable='SECRET_KEY',
-            prompt='application secret key',
-            default=''.join(random.choices(string.ascii_letters + string.digits, k=50)),
-        ),
-    ]
+
+    @classmethod
+    def prompted_context(cls):
+        return super().prompted_context() + (
+            context_factories.PromptedContext(
+                variable='SECRET_KEY',
+                prompt='application secret key',
+                default=''.join(random.choices(string.ascii_letters + string.digits, k=50)),
+            ),
+        )
 
 
 class EmberInitType(InitType):
     name = 'ember'
-    prompted_context = InitType.prompted_context + [
-        context_factories.PromptedContext(
-            variable='KUBE_LIVE_RELOAD_PORT',
-            prompt='live reload development port',
-            default=settings.DEFAULT_KUBE_LIVE_RELOAD_PORT,
-        ),
-    ]
+
+    @classmethod
+    def prompted_context(cls):
+        return super().prompted_context() + (
+            context_factories.PromptedContext(
+                variable='KUBE_LIVE_RELOAD_PORT',
+                prompt='live reload development port',
+                default=settings.DEFAULT_KUBE_LIVE_RELOAD_PORT,
+            ),
+        )
 
 
 all_templates = [
@@ -90,3 +99,5 @@ all_templates = [
     PythonDjangoInitType,
     EmberInitType,
 ]
+
+templates_by_name = {template.name: template for template in all_templates}
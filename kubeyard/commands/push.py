@@ -4,6 +4,8 @@ from kubeyard.commands.devel import BaseDevelCommand
 class PushCommand(BaseDevelCommand):
     """
     Runs `docker push` on docker image built by build command. It also tags image as latest adn push it as well.
+    Both images are pushed in parallel and output of each push is shown when it finishes,
+    use --serial-push to push them one after another with live output.
     Can be overridden in <project_dir>/sripts/push.
 
     If kubeyard is set up in development mode it uses minikube as docker host.
@@ -11,8 +13,17 @@ class PushCommand(BaseDevelCommand):
     Normally you want to run it only in production.
     """
     custom_script_name = 'push'
+    context_vars = ['serial_push']
+
+    def __init__(self, *, serial_push, **kwargs):
+        super().__init__(**kwargs)
+        self.serial_push = serial_push
 
     def run_default(self):
-        self.docker_with_output('push', self.image)
         self.docker_with_output('tag', self.image, self.latest_image)
-        self.docker_with_output('push', self.latest_image)
+        images = [self.image, self.latest_image]
+        if self.serial_push:
+            for image in images:
+                self.docker_with_output('push', image)
+        else:
+            self.docker_runner.run_in_parallel_with_output(*(('push', image) for image in images))
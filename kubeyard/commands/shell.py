@@ -2,10 +2,9 @@ import logging
 
 import sh
 
-from cached_property import cached_property
-
 from kubeyard.base_command import CommandException
 from kubeyard.commands.devel import BaseDevelCommand
+from kubeyard.compat import cached_property
 
 logger = logging.getLogger(__name__)
 
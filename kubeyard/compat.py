@@ -0,0 +1,6 @@
+try:
+    from functools import cached_property
+except ImportError:  # Python < 3.8
+    from cached_property import cached_property
+
+__all__ = ['cached_property']
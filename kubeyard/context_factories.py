@@ -5,13 +5,14 @@ import re
 
 import yaml
 
-from cached_property import cached_property
-
 from kubeyard import io_utils
 from kubeyard import settings
+from kubeyard.compat import cached_property
 
 logger = logging.getLogger(__name__)
 
+_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 class Context(dict):
     def as_environment(self):
@@ -170,6 +171,10 @@ def load_context(path):
         return de_legacy(upper_keys(yaml.safe_load(fp)))
 
 
+def save_context(path, context):
+    path.write_bytes(yaml.dump(dict(context), default_flow_style=False, Dumper=_DUMPER, encoding='utf-8'))
+
+
 def upper_keys(d):
     ret = Context()
     for k, v in d.items():
@@ -1,16 +1,16 @@
+import bisect
 import os
 import pathlib
 
 import click
 
-from cached_property import cached_property
-
 from kubeyard import settings
 from kubeyard.commands import CustomScriptCommand
+from kubeyard.compat import cached_property
 
 
 class CustomCommandsLoader(click.MultiCommand):
-    scripts_dir = pathlib.Path(settings.DEFAULT_KUBEYARD_SCRIPTS_DIR)
+    scripts_dir = pathlib.Path(settings.DEFAULT_KUBEYARD_SCRIPTS_DIR).resolve()
 
     def __init__(self, main_cli: list, **attrs):
         """
@@ -18,26 +18,39 @@ class CustomCommandsLoader(click.MultiCommand):
         """
         super().__init__(**attrs)
         self.main_cli = main_cli
+        self._main_commands = None
+        self._commands = {}
 
     @cached_property
     def custom_scripts(self):
         cmds = {}
-        if self.scripts_dir.exists():
-            scripts_dir = self.scripts_dir.resolve()
-            for filepath in scripts_dir.glob("*"):
-                if filepath.is_file() and self.is_executable(filepath):
-                    cmds[filepath.name] = filepath
+        try:
+            entries = os.scandir(str(self.scripts_dir))
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            return cmds
+        with entries:
+            for entry in entries:
+                if entry.is_file() and self.is_executable(entry.path):
+                    cmds[entry.name] = pathlib.Path(entry.path)
         return cmds
 
     @staticmethod
-    def is_executable(filepath: pathlib.Path) -> bool:
+    def is_executable(filepath: str) -> bool:
         return os.access(filepath, os.X_OK)
 
     def list_commands(self, ctx):
         """Do not override commands from main CLI"""
-        return [cs for cs in self.custom_scripts.keys() if cs not in self.main_cli.list_commands(ctx)]
+        if self._main_commands is None:
+            self._main_commands = frozenset(self.main_cli.list_commands(ctx))
+        return [cs for cs in self.custom_scripts.keys() if cs not in self._main_commands]
 
     def get_command(self, ctx, cmd_name):
+        """Commands are built once per name, as help and completion ask for them repeatedly"""
+        if cmd_name not in self._commands:
+            self._commands[cmd_name] = self._build_command(cmd_name)
+        return self._commands[cmd_name]
+
+    def _build_command(self, cmd_name):
         from kubeyard.entrypoints.kubeyard import apply_common_options
         from kubeyard.entrypoints.kubeyard import initialized_repository_options
 
@@ -54,3 +67,28 @@ class CustomCommandsLoader(click.MultiCommand):
             CustomScriptCommand(script_name=self.custom_scripts[cmd_name], **kwargs).run()
 
         return _custom_script_command
+
+
+class KubeyardCommandCollection(click.CommandCollection):
+    def shell_complete(self, ctx, incomplete):
+        from click.shell_completion import CompletionItem
+
+        results = [
+            CompletionItem(name, help=command.get_short_help_str())
+            for name, command in self.get_commands_starting_with(ctx, incomplete)
+        ]
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+    def get_commands_starting_with(self, ctx, prefix):
+        """
+        Command names are sorted, so binary search finds the first match
+        and all other matches follow it directly.
+        """
+        names = self.list_commands(ctx)
+        index = bisect.bisect_left(names, prefix)
+        while index < len(names) and names[index].startswith(prefix):
+            command = self.get_command(ctx, names[index])
+            if command is not None and not command.hidden:
+                yield names[index], command
+            index += 1
@@ -18,8 +18,9 @@ from kubeyard.commands import ShellCommand
 from kubeyard.commands import TestCommand
 from kubeyard.commands import UpdateRequirementsCommand
 from kubeyard.commands.init import PythonPackageInitType
-from kubeyard.commands.init import all_templates
+from kubeyard.commands.init import templates_by_name
 from kubeyard.entrypoints.custom_command_loader import CustomCommandsLoader
+from kubeyard.entrypoints.custom_command_loader import KubeyardCommandCollection
 
 kubeyard_logging.init_logging()
 logger = logging.getLogger(__name__)
@@ -39,7 +40,9 @@ def cli():
     pass
 
 
-def apply_common_options(options):
+def apply_common_options(*option_groups):
+    options = [option for options in option_groups for option in options]
+
     def wrap(func):
         for option in reversed(options):
             func = option(func)
@@ -85,6 +88,8 @@ devel_options = (
     ),
 )
 
+devel_command_options = apply_common_options(initialized_repository_options, devel_options)
+
 
 @cli.command(
     help=TestCommand.__doc__,
@@ -92,8 +97,7 @@ devel_options = (
         ignore_unknown_options=True,
     ),
 )
-@apply_common_options(initialized_repository_options)
-@apply_common_options(devel_options)
+@devel_command_options
 @click.option(
     "--force-migrate-db",
     "-f-m-db",
@@ -115,15 +119,13 @@ def test(**kwargs):
 
 
 @cli.command(help=FixCodeStyleCommand.__doc__)
-@apply_common_options(initialized_repository_options)
-@apply_common_options(devel_options)
+@devel_command_options
 def fix_code_style(**kwargs):
     FixCodeStyleCommand(**kwargs).run()
 
 
 @cli.command(help=BuildCommand.__doc__)
-@apply_common_options(initialized_repository_options)
-@apply_common_options(devel_options)
+@devel_command_options
 @click.option(
     "--image-context",
     help="Image context containing Dockerfile. Defaults to <project_dir>/docker",
@@ -137,22 +139,24 @@ def build(**kwargs):
 
 
 @cli.command(help=UpdateRequirementsCommand.__doc__)
-@apply_common_options(initialized_repository_options)
-@apply_common_options(devel_options)
+@devel_command_options
 def update_requirements(**kwargs):
     UpdateRequirementsCommand(**kwargs).run()
 
 
 @cli.command(help=PushCommand.__doc__)
-@apply_common_options(initialized_repository_options)
-@apply_common_options(devel_options)
+@devel_command_options
+@click.option(
+    "--serial-push",
+    is_flag=True,
+    help="Push images one after another instead of in parallel. Useful on limited bandwidth.",
+)
 def push(**kwargs):
     PushCommand(**kwargs).run()
 
 
 @cli.command(help=DeployCommand.__doc__)
-@apply_common_options(initialized_repository_options)
-@apply_common_options(devel_options)
+@devel_command_options
 @click.option(
     "--build-url",
     help="URL to a CI/CD (eg. Jenkins) build. It will be used as a pod annotation.",
@@ -241,19 +245,16 @@ def setup(**kwargs):
 @click.option(
     "--template",
     "template_name",
-    type=click.Choice([template.name for template in all_templates]),
+    type=click.Choice(list(templates_by_name)),
     default=PythonPackageInitType.name,
     help="Select ember template.",
 )
 def init(*, template_name, **kwargs):
-    for template in all_templates:
-        if template.name == template_name:
-            return InitCommand(init_type=template, **kwargs).run()
+    InitCommand(init_type=templates_by_name[template_name], **kwargs).run()
 
 
 @cli.command(help=ShellCommand.__doc__)
-@apply_common_options(initialized_repository_options)
-@apply_common_options(devel_options)
+@devel_command_options
 @click.option(
     "--pod",
     "-p",
@@ -280,7 +281,7 @@ def shell(**kwargs):
 
 custom_commands = CustomCommandsLoader(cli, help="Collection of all custom commands")
 
-cli_with_custom_commands = click.CommandCollection(sources=[
+cli_with_custom_commands = KubeyardCommandCollection(sources=[
     cli,
     custom_commands,
 ])
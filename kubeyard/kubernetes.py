@@ -1,5 +1,6 @@
 import collections
 import contextlib
+import functools
 import logging
 import pathlib
 import socket
@@ -9,6 +10,7 @@ import yaml
 
 from kubeyard import minikube
 from kubeyard import settings
+from kubeyard.compat import cached_property
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +30,23 @@ def install_global_secrets(context):
     for path in pathlib.Path(context['KUBEYARD_GLOBAL_SECRETS']).iterdir():
         if path.is_dir():
             GlobalSecretsInstaller(context, path.name).install()
+    _get_global_secrets_manipulator.cache_clear()
     logger.info('Global secrets installed')
 
 
 def get_global_secrets_manipulator(context, secret_name):
+    return _get_global_secrets_manipulator(context['KUBEYARD_GLOBAL_SECRETS'], secret_name)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_global_secrets_manipulator(global_secrets_directory, secret_name):
+    """
+    Manipulators cache what they read from files and from the cluster, so reusing them lets many requirements
+    sharing one global secret (eg. redis) read it once. Cache is cleared when global secrets are installed.
+    """
     return KubernetesSecretsManipulator(
         secret_name,
-        pathlib.Path(context['KUBEYARD_GLOBAL_SECRETS']) / secret_name,
+        pathlib.Path(global_secrets_directory) / secret_name,
     )
 
 
@@ -134,6 +146,10 @@ class KubernetesSecretsManipulator:
             yaml.dump(literal_secrets, yml_source)
 
     def get_literal_secrets_mapping(self):
+        return self._literal_secrets_mapping
+
+    @cached_property
+    def _literal_secrets_mapping(self):
         if self.yml_source_path.exists():
             with self.yml_source_path.open() as yml_source:
                 secrets = yaml.safe_load(yml_source)
@@ -146,16 +162,20 @@ class KubernetesSecretsManipulator:
             self.secrets_path.mkdir(parents=True)
 
     def is_key_present(self, key):
+        return key in self._installed_keys
+
+    @cached_property
+    def _installed_keys(self):
         try:
             yml_output = str(sh.kubectl(
                 'get', 'secrets', self.secret_name,
                 '--output', 'yaml',
             ))
         except sh.ErrorReturnCode:
-            return False
+            return frozenset()
         else:
             secret = yaml.safe_load(yml_output)
-            return key in secret['data']
+            return frozenset(secret['data'])
 
 
 class BaseKubernetesSecretsInstaller:
@@ -7,9 +7,8 @@ import sys
 
 import sh
 
-from cached_property import cached_property
-
 from kubeyard import settings
+from kubeyard.compat import cached_property
 
 logger = logging.getLogger(__name__)
 
@@ -1,9 +1,54 @@
 _kubeyard_completion() {
     local IFS=$'
 '
-    COMPREPLY=( $( env COMP_WORDS="${COMP_WORDS[*]}" \
-                   COMP_CWORD=$COMP_CWORD \
-                   _KUBEYARD_COMPLETE=complete $1 ) )
+    if [ $COMP_CWORD -eq 1 ] && [[ ${COMP_WORDS[1]} != -* ]] && _kubeyard_cached_command_completion "$1"; then
+        return 0
+    fi
+    local response completion type value
+    response=$(env COMP_WORDS="${COMP_WORDS[*]}" COMP_CWORD=$COMP_CWORD _KUBEYARD_COMPLETE=bash_complete $1)
+    COMPREPLY=()
+    for completion in $response; do
+        IFS=',' read type value <<< "$completion"
+        if [[ $type == 'dir' ]]; then
+            COMPREPLY=()
+            compopt -o dirnames
+        elif [[ $type == 'file' ]]; then
+            COMPREPLY=()
+            compopt -o default
+        elif [[ $type == 'plain' ]]; then
+            COMPREPLY+=($value)
+        fi
+    done
+    return 0
+}
+
+# Command names depend only on kubeyard itself and on ./scripts, so they are cached per directory
+# and completed in bash. Python is run again only when kubeyard or ./scripts is newer than the cache.
+# Only the mtime of ./scripts is checked, so `chmod +x` or `chmod -x` on an existing script is not
+# picked up until the cache is refreshed for another reason (eg. a script is added or removed).
+# Returns non-zero when no cache is available, so the caller falls back to live completion.
+_kubeyard_cached_command_completion() {
+    # "_" is escaped before "/" is replaced, so different directories never share a cache file.
+    local cache_key=${PWD//_/_u}
+    local cache_file="${XDG_CACHE_HOME:-$HOME/.cache}/kubeyard/commands${cache_key//\//_s}"
+    if ! [ "$cache_file" -nt scripts ] || ! [ "$cache_file" -nt "$(type -P "$1")" ]; then
+        local response completion commands=()
+        response=$(env COMP_WORDS="$1 " COMP_CWORD=1 _KUBEYARD_COMPLETE=bash_complete $1 2>/dev/null)
+        for completion in $response; do
+            [[ $completion == plain,* ]] && commands+=("${completion#plain,}")
+        done
+        rm -f "$cache_file"
+        if [ ${#commands[@]} -eq 0 ]; then
+            return 1
+        fi
+        {
+            mkdir -p "${cache_file%/*}" &&
+                printf '%s\n' "${commands[@]}" > "$cache_file.$$" &&
+                mv "$cache_file.$$" "$cache_file"
+        } 2>/dev/null || rm -f "$cache_file.$$"
+    fi
+    [ -f "$cache_file" ] || return 1
+    COMPREPLY=( $(compgen -W "$(< "$cache_file")" -- "${COMP_WORDS[1]}") )
     return 0
 }
 
@@ -1,3 +1,4 @@
+import os
 import pathlib
 
 from setuptools import find_packages
@@ -5,14 +6,15 @@ from setuptools import setup
 
 
 def templates():
-    for path in pathlib.Path('kubeyard/templates').glob('**/*'):
-        if not path.is_dir():
-            yield str(path.relative_to('kubeyard'))
+    for dirpath, _, filenames in os.walk('kubeyard/templates'):
+        relative_dirpath = os.path.relpath(dirpath, 'kubeyard')
+        for filename in filenames:
+            yield os.path.join(relative_dirpath, filename)
 
 
-def parse_requirements(filename, *args, **kwargs):
+def parse_requirements(filename):
     """ load requirements from a pip requirements file """
-    lineiter = (line.strip() for line in open(filename))
+    lineiter = (line.strip() for line in pathlib.Path(filename).read_text().splitlines())
     return [line for line in lineiter if line and not line.startswith("#")]
 
 
@@ -31,7 +33,7 @@ setup(
     author_email='it@socialwifi.com',
     url='https://github.com/socialwifi/kubeyard',
     packages=find_packages(exclude=['tests']),
-    install_requires=[str(r) for r in parse_requirements('base_requirements.txt', session=False)],
+    install_requires=parse_requirements('base_requirements.txt'),
     test_suite='tests',
     entry_points={
         'console_scripts': [